@@ -1,40 +1,197 @@
-import random
 import time
-from dataclasses import dataclass
+from collections import deque
 from datetime import date, datetime, timedelta, timezone
-from typing import Generator
+from functools import lru_cache
+from random import random as _rand
+from time import sleep as _tsleep
+from typing import Any, Generator
 
-from dateutil.parser import parse as parse_datetime_str
+try:
+    from ciso8601 import parse_datetime as _iso_parse
+except ImportError:
+    _iso_parse = None
 
-local_timezone = datetime.now().astimezone().tzinfo
+_EPOCH = datetime(1970, 1, 1)
+_mono = time.perf_counter
+_time = time.time
+
+
+@lru_cache(maxsize=64)
+def _datetime_fmt_str(fmt: str, dsep: str, tsep: str) -> str:
+    return f"%{fmt[0]}{dsep}%{fmt[1]}{dsep}%{fmt[2]} %H{tsep}%M{tsep}%S"
+
+
+@lru_cache(maxsize=64)
+def _date_fmt_str(fmt: str, sep: str) -> str:
+    return f"%{fmt[0]}{sep}%{fmt[1]}{sep}%{fmt[2]}"
+
+
+def __getattr__(name: str) -> Any:
+    # dateutil and the local timezone are resolved on first access instead of at import time
+    if name == "parse_datetime_str":
+        from dateutil.parser import parse as parse_datetime_str
+
+        return parse_datetime_str
+    if name == "local_timezone":
+        global local_timezone
+        local_timezone = datetime.now().astimezone().tzinfo
+        return local_timezone
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _has_full_iso_date(s: str) -> bool:
+    # ciso8601 fills partial dates ("2022-11") with the 1st, dateutil with today's day
+    if len(s) >= 10 and s[4] == "-" and s[7] == "-":
+        return s[:4].isdigit() and s[5:7].isdigit() and s[8:10].isdigit()
+    return len(s) >= 8 and s[:8].isdigit() and (len(s) == 8 or s[8] in "T ")
+
+
+@lru_cache(maxsize=4096)
+def _parse_cached(s: str, today: date) -> datetime:
+    # dateutil fills missing fields from today's date, so the date is part of the cache key
+    if _iso_parse is not None and _has_full_iso_date(s):
+        try:
+            return _iso_parse(s)
+        except ValueError:
+            pass
+    from dateutil.parser import parse as parse_datetime_str
+
+    return parse_datetime_str(s, default=datetime(today.year, today.month, today.day))
+
+
+def _from_timestamp(t: float, utc: bool) -> datetime:
+    # The formatters never emit %z/%Z, so a naive UTC wall-clock datetime is enough
+    if utc:
+        return _EPOCH + timedelta(seconds=t)
+    return datetime.fromtimestamp(t)
+
+
+def _now(_, utc: bool) -> datetime:
+    return _from_timestamp(_time(), utc)
+
+
+def _from_str(s: str, utc: bool) -> datetime:
+    return _parse_cached(s, date.today())
+
+
+def _identity(d, utc: bool):
+    return d
+
+
+def _today(_, utc: bool) -> date:
+    return date.fromtimestamp(time.time())
+
+
+def _date_from_timestamp(t: float, utc: bool) -> date:
+    return date.fromtimestamp(t)
+
+
+def _date_from_datetime(d: datetime, utc: bool) -> date:
+    return d.date()
+
+
+# Input converters keyed by exact type. Subclasses are resolved through isinstance in _coerce,
+# so the key order matters (datetime must come before date).
+_DATETIME_DISPATCH = {
+    type(None): _now,
+    str: _from_str,
+    float: _from_timestamp,
+    int: _from_timestamp,
+    datetime: _identity,
+}
+_TIME_DISPATCH = {
+    type(None): _now,
+    datetime: _identity,
+    float: _from_timestamp,
+    int: _from_timestamp,
+}
+_DATE_DISPATCH = {
+    type(None): _today,
+    float: _date_from_timestamp,
+    int: _date_from_timestamp,
+    datetime: _date_from_datetime,
+    date: _identity,
+}
+
+
+def _coerce(value, dispatch: dict, utc: bool):
+    fn = dispatch.get(type(value))
+    if fn is None:
+        for tp, converter in dispatch.items():
+            if isinstance(value, tp):
+                fn = converter
+                break
+        else:
+            raise TypeError(type(value))
+    return fn(value, utc)
+
+
+# Specialized formatters for the common date formats. Other formats fall back to strftime.
+_DATE_FORMATTERS = {
+    "Ymd": lambda d, sep: f"{d.year:04d}{sep}{d.month:02d}{sep}{d.day:02d}",
+    "dmY": lambda d, sep: f"{d.day:02d}{sep}{d.month:02d}{sep}{d.year:04d}",
+    "mdY": lambda d, sep: f"{d.month:02d}{sep}{d.day:02d}{sep}{d.year:04d}",
+}
 
 
-@dataclass
 class TimerStop:
-    total: timedelta
-    since_last: timedelta
-    at: float
-    label: str | None = None
+    __slots__ = ("total", "since_last", "at", "label")
+
+    def __init__(self, total: float, since_last: float, at: float, label: str | None = None):
+        self.total = total
+        self.since_last = since_last
+        self.at = at
+        self.label = label
+
+    def __repr__(self) -> str:
+        return f"TimerStop(total={self.total!r}, since_last={self.since_last!r}, at={self.at!r}, label={self.label!r})"
+
+    @property
+    def total_td(self) -> timedelta:
+        """Total elapsed time as timedelta."""
+        return timedelta(seconds=self.total)
+
+    @property
+    def since_last_td(self) -> timedelta:
+        """Time since the previous stop as timedelta."""
+        return timedelta(seconds=self.since_last)
 
     def __str__(self) -> str:
+        total = self.total_td
+        since_last = self.since_last_td
         if self.label is None:
-            return f"total={self.total}, since_last=({self.since_last}), at={datetime_fmt(self.at)}"
-        return f"{self.label} | total={self.total}, since_last={self.since_last}, at={datetime_fmt(self.at)}"
+            return f"total={total}, since_last=({since_last}), at={datetime_fmt(self.at)}"
+        return f"{self.label} | total={total}, since_last={since_last}, at={datetime_fmt(self.at)}"
 
     def total_seconds(self, *, r: int | None = None) -> float:
-        seconds = self.total.total_seconds()
         if r is not None:
-            return round(seconds, r)
-        return seconds
+            return round(self.total, r)
+        return self.total
 
 
 class Timer:
-    """A simple timer class that keeps track of all the stops."""
+    """
+    A simple timer class that keeps track of all the stops.
+
+    Args:
+        ms (bool, optional): Keep fractions of a second in stop durations.
+        keep (int | None, optional): Only keep the last ``keep`` stops. Keeps all stops if None.
+    """
 
-    def __init__(self, *, ms: bool = True):
+    def __init__(self, *, ms: bool = True, keep: int | None = None):
         self.ms = ms
+        self.keep = keep
         self.reset()
 
+    @property
+    def ms(self) -> bool:
+        return self._ms
+
+    @ms.setter
+    def ms(self, value: bool) -> None:
+        self._ms = value
+        self._round = float if value else round
+
     def stop(self, label: str | None = None) -> TimerStop:
         """
         Stop the timer.
@@ -45,23 +202,13 @@ class Timer:
         Returns:
             TimerStop: The stop data
         """
-        t = time.perf_counter()
-        elapsed_total = t - self.start
-        since_last = t - self.stops[-1].at if self.stops else 0
-        if not self.ms:
-            elapsed_total = round(elapsed_total)
-            since_last = round(since_last)
-
-        elapsed_total = timedelta(seconds=elapsed_total)
-        since_last = timedelta(seconds=since_last)
-
+        t_mono = _mono()
+        _round = self._round
         timer_stop = TimerStop(
-            total=elapsed_total,
-            since_last=since_last,
-            at=t,
-            label=label,
+            _round(t_mono - self._start_mono), _round(t_mono - self._last_mono), _time(), label
         )
-        self.stops.append(timer_stop)
+        self._last_mono = t_mono
+        self._append_stop(timer_stop)
         return timer_stop
 
     def taken_seconds(self, r: int | None = None) -> float:
@@ -74,19 +221,34 @@ class Timer:
         """
         Returns the total time taken by the timer as timedelta.
         """
-        return self.stop().total
+        return self.stop().total_td
+
+    def totals(self):
+        """
+        Returns the total elapsed seconds of all stops as a NumPy ``float64`` array.
+        Requires ``numpy`` (``pip install stdl[numpy]``).
+        """
+        import numpy as np
+
+        return np.fromiter(
+            (stop.total for stop in self.stops), dtype=np.float64, count=len(self.stops)
+        )
 
     def reset(self) -> None:
         """Reset the timer."""
-        self.start = time.perf_counter()
-        self.stops: list[TimerStop] = [
-            TimerStop(
-                total=timedelta(seconds=0),
-                since_last=timedelta(seconds=0),
-                at=self.start,
-                label="start",
-            )
-        ]
+        self.start = _time()
+        self._start_mono = self._last_mono = _mono()
+        start_stop = TimerStop(
+            total=0.0,
+            since_last=0.0,
+            at=self.start,
+            label="start",
+        )
+        if self.keep is None:
+            self.stops: list[TimerStop] | deque[TimerStop] = [start_stop]
+        else:
+            self.stops = deque([start_stop], maxlen=self.keep)
+        self._append_stop = self.stops.append
 
 
 def datetime_fmt(
@@ -125,23 +287,15 @@ def datetime_fmt(
         "01/01/1970 00:00:00"
         ```
     """
-    if d is None:
-        d = datetime.fromtimestamp(time.time(), **{"tz": timezone.utc} if utc else {})
-
-    elif isinstance(d, str):
-        d = parse_datetime_str(d)
-    elif isinstance(d, (float, int)):
-        d = datetime.fromtimestamp(d, **{"tz": timezone.utc} if utc else {})
-    elif isinstance(d, datetime):
-        pass
+    d = _coerce(d, _DATETIME_DISPATCH, utc)
+    formatter = _DATE_FORMATTERS.get(fmt)
+    if formatter is None:
+        dt_str = d.strftime(_datetime_fmt_str(fmt, dsep, tsep))
     else:
-        raise TypeError(type(d))
-    date_fmt = f"%{fmt[0]}{dsep}%{fmt[1]}{dsep}%{fmt[2]}"
-    time_fmt = f"%H{tsep}%M{tsep}%S"
+        dt_str = f"{formatter(d, dsep)} {d.hour:02d}{tsep}{d.minute:02d}{tsep}{d.second:02d}"
     if ms:
-        time_fmt += ".%f"
-    dt_str = d.strftime(f"{date_fmt} {time_fmt}")
-    return dt_str[:-3] if ms else dt_str
+        dt_str = f"{dt_str}.{d.microsecond // 1000:03d}"
+    return dt_str
 
 
 def time_fmt(
@@ -162,18 +316,10 @@ def time_fmt(
     Returns:
         str: Formated time.
     """
-    if t is None:
-        tm = datetime.fromtimestamp(time.time(), **{"tz": timezone.utc} if utc else {})
-    elif isinstance(t, datetime):
-        tm = t.time()
-    elif isinstance(t, (int, float)):
-        tm = datetime.fromtimestamp(t, **{"tz": timezone.utc} if utc else {})
-    else:
-        raise TypeError(type(t))
-    ts = tm.strftime(f"%H{sep}%M{sep}%S")
+    tm = _coerce(t, _TIME_DISPATCH, utc)
+    ts = f"{tm.hour:02d}{sep}{tm.minute:02d}{sep}{tm.second:02d}"
     if ms:
-        ms_str = f"{int(tm.microsecond / 1000)}".zfill(3)
-        ts = f"{ts}.{ms_str}"
+        ts = f"{ts}.{tm.microsecond // 1000:03d}"
     return ts
 
 
@@ -208,22 +354,22 @@ def date_fmt(
         '2022-11-22'
         ```
     """
-    if d is None:
-        d = date.fromtimestamp(time.time())
-    elif isinstance(d, (float, int)):
-        d = date.fromtimestamp(d)
-    elif isinstance(d, datetime):
-        d = d.date()
-    elif isinstance(d, date):
-        pass
-    else:
-        raise TypeError(type(d))
-    return d.strftime(f"%{fmt[0]}{sep}%{fmt[1]}{sep}%{fmt[2]}")
+    d = _coerce(d, _DATE_DISPATCH, False)
+    if fmt == "Ymd":
+        if sep == "-":
+            return d.isoformat()
+        return d.isoformat().replace("-", sep)
+    formatter = _DATE_FORMATTERS.get(fmt)
+    if formatter is None:
+        return d.strftime(_date_fmt_str(fmt, sep))
+    return formatter(d, sep)
 
 
 def date_range(start: date, end: date) -> Generator[date, None, None]:
     """
-    Returns a generator for dates between ``start`` and ``end``
+    Returns a generator for dates between ``start`` and ``end``.
+
+    Use ``date_range_array`` to build the whole range at once as a NumPy array.
 
     Example:
         ```python
@@ -233,8 +379,28 @@ def date_range(start: date, end: date) -> Generator[date, None, None]:
         2022-11-21
         ```
     """
-    for n in range(int((end - start).days)):
-        yield start + timedelta(n)
+    cur = start
+    one_day = timedelta(1)
+    for _ in range((end - start).days):
+        yield cur
+        cur += one_day
+
+
+def date_range_array(start: date, end: date):
+    """
+    Returns a NumPy ``datetime64[D]`` array of dates between ``start`` and ``end``.
+    Use this instead of ``date_range`` when the whole range is needed at once.
+    Requires ``numpy`` (``pip install stdl[numpy]``).
+
+    Example:
+        ```python
+        >>> date_range_array(date(2022,11,19), date(2022,11,22))
+        array(['2022-11-19', '2022-11-20', '2022-11-21'], dtype='datetime64[D]')
+        ```
+    """
+    import numpy as np
+
+    return np.arange(np.datetime64(start, "D"), np.datetime64(end, "D"), np.timedelta64(1, "D"))
 
 
 def sleep(lo: float, hi: float | None = None) -> float:
@@ -253,12 +419,12 @@ def sleep(lo: float, hi: float | None = None) -> float:
     """
 
     if hi is None:
-        time.sleep(lo)
+        _tsleep(lo)
         return lo
-    if lo < hi:
+    if lo > hi:
         raise ValueError(f"Minimum sleep time is higher that maximum. {(lo,hi)}")
-    t = random.uniform(lo, hi)
-    time.sleep(t)
+    t = lo + (hi - lo) * _rand()
+    _tsleep(t)
     return t
 
 
@@ -277,15 +443,16 @@ def seconds_to_hms(time: int | float, ms: bool = False) -> str:
     sign = "-" if time < 0 else ""
     time = abs(time)
 
-    s = int(time % 60)
-    m = int((time // 60) % 60)
-    h = int(time // 3600)
-    time_str = f"{sign}{h:02d}:{m:02d}:{s:02d}"
+    if not ms:
+        m, s = divmod(int(time), 60)
+        h, m = divmod(m, 60)
+        return f"{sign}{h:02d}:{m:02d}:{s:02d}"
 
-    if ms:
-        milis = int(round((time - int(time)) * 1000))
-        time_str += f".{milis:03d}"
-    return time_str
+    # Round to whole milliseconds first so .9995 carries into the seconds
+    s, milis = divmod(round(time * 1000), 1000)
+    m, s = divmod(s, 60)
+    h, m = divmod(m, 60)
+    return f"{sign}{h:02d}:{m:02d}:{s:02d}.{milis:03d}"
 
 
 def hms_to_seconds(time: str, ms: bool = False) -> float | None:
@@ -348,11 +515,12 @@ def hms_to_seconds(time: str, ms: bool = False) -> float | None:
 
 __all__ = [
     "Timer",
-    "parse_datetime_str",
+    "parse_datetime_str",  # noqa: F822 (provided by the module __getattr__)
     "datetime_fmt",
     "time_fmt",
     "date_fmt",
     "date_range",
+    "date_range_array",
     "sleep",
     "local_timezone",
     "timezone",
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+import codecs
+import errno
 import json
-import math
+import locale
 import os
 import pickle
 import platform
-import random
 import re
 import shlex
 import shutil
@@ -14,14 +15,19 @@ import sys
 import time
 from collections.abc import Iterable
 from datetime import datetime
+from functools import lru_cache
 from os import PathLike
 from pathlib import Path
-from queue import Queue
 from typing import IO, Any, Generator, Literal
 
 import toml
 import yaml
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from stdl import st
 
 stat = os.stat
@@ -62,7 +68,11 @@ def pickle_dump(data: Any, filepath: str | PathLike) -> None:
     Dumps an object to the specified filepath."""
 
     with open(filepath, "wb") as f:
-        pickle.dump(data, f)
+        f.write(pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def _is_utf8(encoding: str) -> bool:
+    return codecs.lookup(encoding).name == "utf-8"
 
 
 def json_load(path: str | PathLike, encoding="utf-8") -> dict[Any, Any] | list[dict[Any, Any]]:
@@ -76,7 +86,16 @@ def json_load(path: str | PathLike, encoding="utf-8") -> dict[Any, Any] | list[d
     Returns:
         dict | list[dict]: The JSON data loaded from the file.
     """
-    with open(os.fspath(path), "r", encoding=encoding) as f:
+    path = os.fspath(path)
+    if orjson is not None and _is_utf8(encoding):
+        with open(path, "rb") as f:
+            data = f.read()
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson is stricter than json (e.g. NaN, very large integers)
+            return json.loads(data.decode(encoding))
+    with open(path, "r", encoding=encoding) as f:
         return json.load(f)
 
 
@@ -99,31 +118,28 @@ def json_append(
         indent (int, optional): The number of spaces to use for indentation. Defaults to 4.
     """
 
-    file = File(filepath)
     path = os.fspath(filepath)
-    if not file.exists or file.size == 0:
-        json_dump([data], filepath, encoding=encoding, indent=indent, default=default)
+    try:
+        fd = os.open(path, os.O_RDWR | getattr(os, "O_BINARY", 0))
+    except FileNotFoundError:
+        json_dump([data], path, encoding=encoding, indent=indent, default=default)
         return
-    with open(path, "a+", encoding=encoding) as f:
-        f.seek(0)
+    if os.fstat(fd).st_size == 0:
+        os.close(fd)
+        json_dump([data], path, encoding=encoding, indent=indent, default=default)
+        return
+    with os.fdopen(fd, "r+", encoding=encoding) as f:
         first_char = f.read(1)
         if first_char == "[":
             f.seek(0, os.SEEK_END)
             f.seek(f.tell() - 2, os.SEEK_SET)
-            f.truncate()
-            f.write(",\n")
-            json.dump(data, f, indent=indent, default=default)
-            f.write("]\n")
+            f.write(f",\n{json.dumps(data, indent=indent, default=default)}]\n")
         elif first_char == "{":
             file_data = first_char + f.read()
             f.seek(0)
+            f.write(f"[\n{file_data},\n{json.dumps(data, indent=indent, default=default)}]\n")
+            # Text mode reads CRLF back as LF, so the rewrite can be shorter than the file
             f.truncate()
-            f.seek(0)
-            f.write("[\n")
-            f.write(file_data)
-            f.write(",\n")
-            json.dump(data, f, indent=indent, default=default)
-            f.write("]\n")
         else:
             raise ValueError(f"Cannot parse '{path}' as JSON.")
 
@@ -186,24 +202,46 @@ def toml_dump(data, path: str | PathLike, encoding: str = "utf-8") -> str:
 
 def get_dir_size(directory: str | PathLike, *, readable: bool = False) -> str | int:
     """
-    Moves files to a specified directory
+    Returns the total size of all files in a directory and its subdirectories.
+    Symbolic links are skipped.
 
     Args:
         directory (str, Path): target directory
         readable (bool, optional): Return the size in human-readable format
     """
     total_size = 0
-    for dirpath, _, filenames in os.walk(directory):
-        for f in filenames:
-            fp = os.path.join(dirpath, f)
-            # Skip if it's symbolic link.
-            if not os.path.islink(fp):
-                total_size += os.path.getsize(fp)
+    stack = [os.fspath(directory)]
+    while stack:
+        try:
+            scanner = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with scanner:
+            for entry in scanner:
+                if entry.is_symlink():
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                else:
+                    total_size += entry.stat(follow_symlinks=False).st_size
     if readable:
         return bytes_readable(total_size)
     return total_size
 
 
+def _replace(src: str, dst: str) -> None:
+    """os.replace with a shutil.move fallback for moves across filesystems."""
+    try:
+        os.replace(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(src, dst)
+
+
+_DIR_FD_MOVE_THRESHOLD = 8
+
+
 def move_files(
     files: list[str | PathLike], directory: str | PathLike, *, mkdir: bool = False
 ) -> None:
@@ -219,13 +257,33 @@ def move_files(
         FileNotFoundError : if the target directory does not exist and mkdir is False.
     """
     directory = os.fspath(directory)
-    if exists(directory):
+    if not os.path.isdir(directory):
         if mkdir:
             os.makedirs(directory, exist_ok=True)
         else:
             raise FileNotFoundError(f"{directory} is not a directory")
-    for file in files:
-        os.rename(os.fspath(file), f"{directory}{SEP}{os.path.basename(file)}")
+    paths = [os.fspath(file) for file in files]
+    sep, basename = SEP, os.path.basename
+    # os.replace is never listed in supports_dir_fd, but takes dst_dir_fd wherever os.rename does
+    if len(paths) < _DIR_FD_MOVE_THRESHOLD or os.rename not in os.supports_dir_fd:
+        for path in paths:
+            _replace(path, f"{directory}{sep}{basename(path)}")
+        return
+
+    # Open the target directory once and rename relative to it, so the destination
+    # path isn't resolved again for every file.
+    dir_fd = os.open(directory, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+    try:
+        for path in paths:
+            name = basename(path)
+            try:
+                os.replace(path, name, dst_dir_fd=dir_fd)
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                shutil.move(path, f"{directory}{sep}{name}")
+    finally:
+        os.close(dir_fd)
 
 
 def rand_filename(prefix: str = "file", ext: str = "", include_datetime: bool = False) -> str:
@@ -243,15 +301,22 @@ def rand_filename(prefix: str = "file", ext: str = "", include_datetime: bool =
     """
     if ext and not ext.startswith("."):
         ext = f".{ext}"
-    num = str(random.randrange(1000000000, 9999999999)).zfill(10)
+    num = os.urandom(5).hex()
     if include_datetime:
-        creation_time = datetime.now().strftime("%Y-%m-%d.%H-%M-%S-%f")[:-3]
+        d = datetime.now()
+        creation_time = (
+            f"{d.year:04d}-{d.month:02d}-{d.day:02d}."
+            f"{d.hour:02d}-{d.minute:02d}-{d.second:02d}-{d.microsecond // 1000:03d}"
+        )
         filename = f"{prefix}.{num}.{creation_time}{ext}"
     else:
         filename = f"{prefix}.{num}{ext}"
     return safe_filename(filename)
 
 
+_SIZE_NAMES = ("B", "KB", "MB", "GB", "TB", "PB", "EB", "ZB", "YB")
+
+
 def bytes_readable(size_bytes: int) -> str:
     """Convert bytes to a human-readable string.
     Args:
@@ -263,11 +328,14 @@ def bytes_readable(size_bytes: int) -> str:
         raise ValueError(size_bytes)
     if size_bytes == 0:
         return "0B"
-    i = int(math.floor(math.log(size_bytes, 1024)))
-    p = math.pow(1024, i)
-    s = round(size_bytes / p, 2)
-    size_name = ("B", "KB", "MB", "GB", "TB", "PB", "EB", "ZB", "YB")
-    return f"{s} {size_name[i]}"
+    i = min((int(size_bytes).bit_length() - 1) // 10, len(_SIZE_NAMES) - 1)
+    s = round(size_bytes / (1 << (i * 10)), 2)
+    return f"{s} {_SIZE_NAMES[i]}"
+
+
+_SIZE_RE = re.compile(r"^(\d+(?:\.\d+)?)(B|KB|MB|GB|TB)$")
+_UNITS_1024 = {"B": 1, "KB": 1024, "MB": 1024**2, "GB": 1024**3, "TB": 1024**4}
+_UNITS_1000 = {"B": 1, "KB": 1000, "MB": 1000**2, "GB": 1000**3, "TB": 1000**4}
 
 
 def readable_size_to_bytes(size: str, kb_size: Literal[1000, 1024] = 1024) -> int:
@@ -285,13 +353,13 @@ def readable_size_to_bytes(size: str, kb_size: Literal[1000, 1024] = 1024) -> in
     if size.isdigit():
         return int(size)
 
-    match = re.match(r"^(\d+(\.\d+)?)(B|KB|MB|GB|TB)$", size)
+    match = _SIZE_RE.match(size)
     if not match:
         raise ValueError(f"Invalid size format: {size}")
 
-    number, unit = float(match.group(1)), match.group(3)
+    number, unit = float(match.group(1)), match.group(2)
 
-    units = {"B": 1, "KB": kb_size, "MB": kb_size**2, "GB": kb_size**3, "TB": kb_size**4}
+    units = _UNITS_1024 if kb_size == 1024 else _UNITS_1000
 
     if unit not in units:
         raise ValueError(f"Invalid unit: {unit}")
@@ -313,11 +381,12 @@ def windows_has_drive(letter: str) -> bool:
     return os.path.exists(f"{letter}:{SEP}")
 
 
+@lru_cache(maxsize=None)
 def is_wsl() -> bool:
     """
     Check if the current platform is Windows Subsystem for Linux (WSL).
     """
-    return sys.platform == "linux" and "microsoft" in platform.platform()
+    return sys.platform == "linux" and "microsoft" in platform.uname().release.lower()
 
 
 def mkdir(path: str | Path, mode: int = 511, exist_ok: bool = True) -> None:
@@ -328,7 +397,7 @@ def mkdir(path: str | Path, mode: int = 511, exist_ok: bool = True) -> None:
         path (str | Path): The path of the directory to create.
         exist_ok (bool, optional): Whether to raise an exception if the directory already exists. Defaults to True.
     """
-    os.makedirs(os.fspath(path), exist_ok=exist_ok, mode=mode)
+    os.makedirs(path, exist_ok=exist_ok, mode=mode)
 
 
 def mkdirs(dest: str | Path, names: list[str]) -> None:
@@ -339,12 +408,9 @@ def mkdirs(dest: str | Path, names: list[str]) -> None:
         dest (str | Path): The destination directory.
         names (list[str]): A list of directory names to be created in the destination directory.
     """
-    if not exists(dest):
-        mkdir(dest)
-    for i in names:
-        if not exists(i):
-            path = f"{dest}{SEP}{i}"
-            mkdir(path)
+    mkdir(dest)
+    for name in names:
+        mkdir(os.path.join(dest, name))
 
 
 def yield_files_in(
@@ -370,41 +436,40 @@ def yield_files_in(
     Yields:
         Generator[str, None, None]: The absolute paths of the files in the directory, matching the provided extension.
     """
+    _abspath = os.path.abspath
+    if ext is not None:
+        # Lowercase the extensions once and match them against the entry name only
+        ext = (ext.lower(),) if isinstance(ext, str) else tuple(e.lower() for e in ext)
+
     if not recursive:
         for entry in os.scandir(directory):
             if not entry.is_file():
                 continue
-            path = entry.path
-            if abs:
-                path = os.path.abspath(entry.path)
-            if ext is None:
-                yield path
-            else:
-                if path.lower().endswith(ext):
-                    yield path
+            if ext is None or entry.name.lower().endswith(ext):
+                yield _abspath(entry.path) if abs else entry.path
         return
 
-    queue = Queue()
-    queue.put(directory)
+    stack = [os.fspath(directory)]
 
     if ext is None:
-        while not queue.empty():
-            next_dir = queue.get()
+        while stack:
+            next_dir = stack.pop()
             for entry in os.scandir(next_dir):
                 if entry.is_dir():
-                    queue.put(entry.path)
+                    stack.append(entry.path)
                 elif entry.is_file():
-                    yield os.path.abspath(entry.path) if abs else entry.path
+                    yield _abspath(entry.path) if abs else entry.path
         return
 
-    while not queue.empty():
-        next_dir = queue.get()
+    _lower = str.lower
+    while stack:
+        next_dir = stack.pop()
         for entry in os.scandir(next_dir):
             if entry.is_dir():
-                queue.put(entry.path)
+                stack.append(entry.path)
             elif entry.is_file():
-                if entry.path.lower().endswith(ext):
-                    yield os.path.abspath(entry.path) if abs else entry.path
+                if _lower(entry.name).endswith(ext):
+                    yield _abspath(entry.path) if abs else entry.path
 
 
 def get_files_in(
@@ -450,15 +515,15 @@ def yield_dirs_in(
     Yields:
         Generator[str, None, None]: The paths of the directories that are found during travelsal.
     """
-    queue = Queue()
-    queue.put(directory)
-    while not queue.empty():
-        next_dir = queue.get()
+    _abspath = os.path.abspath
+    stack = [os.fspath(directory)]
+    while stack:
+        next_dir = stack.pop()
         for entry in os.scandir(next_dir):
             if entry.is_dir():
                 if recursive:
-                    queue.put(entry.path)
-                yield os.path.abspath(entry.path) if abs else entry.path
+                    stack.append(entry.path)
+                yield _abspath(entry.path) if abs else entry.path
 
 
 def get_dirs_in(directory: str | Path, *, recursive: bool = True, abs: bool = True) -> list[str]:
@@ -477,6 +542,14 @@ def get_dirs_in(directory: str | Path, *, recursive: bool = True, abs: bool = Tr
     return list(yield_dirs_in(directory, recursive=recursive, abs=abs))
 
 
+def _iter_paths(args) -> Generator[str | PathLike, None, None]:
+    for path in args:
+        if isinstance(path, (str, bytes, PathLike)):
+            yield path
+        elif isinstance(path, Iterable):
+            yield from path
+
+
 def ensure_paths_exist(*args: str | PathLike | Iterable[str | PathLike]) -> None:
     """
     Ensures that the specified paths exist.
@@ -487,18 +560,10 @@ def ensure_paths_exist(*args: str | PathLike | Iterable[str | PathLike]) -> None
     Raises:
         FileNotFoundError : if one of the provided paths does not exist.
     """
-
-    def check_path(path: str | PathLike):
-        if not os.path.exists(os.fspath(path)):
+    for path in _iter_paths(args):
+        if not os.path.exists(path):
             raise FileNotFoundError(f"Path does not exist: '{path}'")
 
-    for path in args:
-        if isinstance(path, (str, bytes, PathLike)):
-            check_path(path)
-        elif isinstance(path, Iterable):
-            for i in path:
-                check_path(i)
-
 
 def ensure_paths_dont_exist(*args: str | PathLike | Iterable[str | PathLike]) -> None:
     """
@@ -510,18 +575,10 @@ def ensure_paths_dont_exist(*args: str | PathLike | Iterable[str | PathLike]) ->
     Raises:
         FileNotFoundError : if one of the provided paths exists.
     """
-
-    def check_path(path: str | PathLike):
-        if os.path.exists(os.fspath(path)):
+    for path in _iter_paths(args):
+        if os.path.exists(path):
             raise FileExistsError(f"Path already exists: '{path}'")
 
-    for path in args:
-        if isinstance(path, (str, bytes, PathLike)):
-            check_path(path)
-        elif isinstance(path, Iterable):
-            for i in path:
-                check_path(i)
-
 
 def safe_filename(name: str) -> str:
     newname = name.replace('"', "'")
@@ -585,6 +642,22 @@ class CompletedCommand(subprocess.CompletedProcess):
         }
 
 
+@lru_cache(maxsize=256)
+def _split_cmd(cmd: str) -> tuple[str, ...]:
+    return tuple(shlex.split(cmd))
+
+
+def _resolve_executable(name, path: str | None) -> str | None:
+    # With close_fds=False, subprocess only takes its posix_spawn path for an executable with a
+    # directory component. Not cached, so PATH changes and removed binaries are picked up.
+    if os.path.dirname(name):
+        return None
+    executable = shutil.which(name, path=path)
+    if executable is None or not os.path.isabs(executable):
+        return None
+    return executable
+
+
 def exec_cmd(
     cmd: list[str] | str,
     timeout: float = None,  # type:ignore
@@ -598,6 +671,7 @@ def exec_cmd(
     input: str | bytes = None,  # type:ignore
     env: dict = None,  # type:ignore
     text: bool = True,
+    bufsize: int = -1,
     *args,
     **kwargs,
 ) -> CompletedCommand:
@@ -617,6 +691,7 @@ def exec_cmd(
         input (str | bytes): input to send to the command.
         env (dict, optional): environment variables to pass to the new process.
         text (bool): whether or not to return output as text or bytes.
+        bufsize (int, optional): buffer size of the pipe file objects, passed to subprocess.Popen.
         *args : additional arguments to pass to subprocess.run.
         **kwargs : additional keyword arguments to pass to subprocess.run.
 
@@ -624,9 +699,21 @@ def exec_cmd(
         subprocess.CompletedProcess : the completed process.
     """
     if isinstance(cmd, str):
-        cmd = shlex.split(cmd)
+        cmd = list(_split_cmd(cmd))
+
+    if (
+        os.name == "posix"
+        and kwargs.get("close_fds") is False
+        and not shell
+        and not args
+        and "executable" not in kwargs
+        and cmd
+    ):
+        executable = _resolve_executable(cmd[0], (os.environ if env is None else env).get("PATH"))
+        if executable is not None:
+            kwargs["executable"] = executable
 
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
 
     result = subprocess.run(
         cmd,
@@ -641,6 +728,7 @@ def exec_cmd(
         input=input,
         env=env,
         cwd=cwd,
+        bufsize=bufsize,
         *args,
         **kwargs,
     )
@@ -648,19 +736,93 @@ def exec_cmd(
     return CompletedCommand(
         result.args,
         result.returncode,
-        time.time() - start_time,
+        (time.perf_counter_ns() - start_ns) / 1e9,
         result.stdout,
         result.stderr,
     )
 
 
+_STDIN_ISATTY: tuple[Any, bool] | None = None
+
+
+def _stdin_isatty(stdin) -> bool:
+    # Keyed on the stream object so a replaced sys.stdin is re-checked
+    global _STDIN_ISATTY
+    cached = _STDIN_ISATTY
+    if cached is not None and cached[0] is stdin:
+        return cached[1]
+    isatty = stdin.isatty()
+    _STDIN_ISATTY = (stdin, isatty)
+    return isatty
+
+
 def read_piped() -> str:
     """
     Reads piped input from stdin.
     """
-    if sys.stdin.isatty():
+    stdin = sys.stdin
+    if _stdin_isatty(stdin):
         return ""
-    return sys.stdin.read().strip()
+    return stdin.read().strip()
+
+
+def read_piped_iter(chunk: int = 65536) -> Generator[str, None, None]:
+    """
+    Lazily read piped input from stdin in chunks.
+
+    Args:
+        chunk (int, optional): Number of characters to read at a time.
+
+    Yields:
+        str: Text chunks. Nothing is yielded if stdin is a terminal.
+    """
+    stdin = sys.stdin
+    if _stdin_isatty(stdin):
+        return
+    while data := stdin.read(chunk):
+        yield data
+
+
+@lru_cache(maxsize=None)
+def _wslview() -> str | None:
+    return shutil.which("wslview")
+
+
+def _wsl_open_argv(path: str) -> list[str]:
+    wslview = _wslview()
+    if wslview is not None:
+        return [wslview, path]
+    quoted = path.replace("'", "''")
+    return ["powershell.exe", "-NoProfile", "-Command", f"Start-Process -FilePath '{quoted}'"]
+
+
+def _start_file_wsl(path: str) -> None:
+    exec_cmd(_wsl_open_argv(path), check=True)
+
+
+def _start_file_mac(path: str) -> None:
+    exec_cmd(["open", path], check=True)
+
+
+def _start_file_linux(path: str) -> None:
+    exec_cmd(["xdg-open", path], check=True)
+
+
+def _start_file_unsupported(path: str) -> None:
+    raise NotImplementedError(f"Unsupported platform: {sys.platform}")
+
+
+# The platform cannot change within a process, so the backend is picked once at import.
+if is_wsl():
+    _START_FILE_IMPL = _start_file_wsl
+elif sys.platform == "win32":
+    _START_FILE_IMPL = os.startfile  # type:ignore
+elif sys.platform == "darwin":
+    _START_FILE_IMPL = _start_file_mac
+elif sys.platform == "linux":
+    _START_FILE_IMPL = _start_file_linux
+else:
+    _START_FILE_IMPL = _start_file_unsupported
 
 
 def start_file(path: str | PathLike) -> None:
@@ -671,17 +833,17 @@ def start_file(path: str | PathLike) -> None:
     to open the specified file with the default application. It supports Windows, macOS,
     and Linux, including Windows Subsystem for Linux (WSL).
     """
-    path = os.fspath(path)
-    if is_wsl():
-        exec_cmd(f"cmd.exe /C start '{path}'", check=True)
-    elif sys.platform == "win32":
-        os.startfile(path)
-    elif sys.platform == "darwin":
-        exec_cmd(f"open {path}", check=True)
-    elif sys.platform == "linux":
-        exec_cmd(f"xdg-open '{path}'", check=True)
-    else:
-        raise NotImplementedError(f"Unsupported platform: {sys.platform}")
+    _START_FILE_IMPL(os.fspath(path))
+
+
+@lru_cache(maxsize=4096)
+def _split_path(path: str) -> tuple[str, str, str, str]:
+    """Split a file path into (dirname, basename, stem, ext)."""
+    dirname, basename = os.path.split(path)
+    stem, dot, ext = basename.rpartition(".")
+    if not dot:
+        stem, ext = basename, ""
+    return dirname, basename, stem, ext
 
 
 class PathBase(PathLike):
@@ -955,6 +1117,16 @@ class File(PathBase):
         """
         super().__init__(path, abs=abs)
         self.encoding = encoding
+        self._parts_path: str | None = None
+        self._parts: tuple[str, str, str, str] = ("", "", "", "")
+
+    def _split(self) -> tuple[str, str, str, str]:
+        """Returns (dirname, basename, stem, ext) for the current path, cached until the path changes."""
+        path = self.path
+        if self._parts_path is not path:
+            self._parts = _split_path(path)
+            self._parts_path = path
+        return self._parts
 
     @property
     def exists(self) -> bool:
@@ -963,28 +1135,28 @@ class File(PathBase):
     @property
     def parent(self) -> "Directory":
         """The parent directory."""
-        return Directory(os.path.dirname(self.path))
+        return Directory(self._split()[0])
 
     @property
     def dirname(self) -> str:
         """The file's directory name."""
-        return os.path.dirname(self.path)
+        return self._split()[0]
+
+    @property
+    def basename(self) -> str:
+        """The base name of the file (without the parent directory)."""
+        return self._split()[1]
 
     @property
     def ext(self) -> str:
         """The file's extension (without the dot).
         Returns empty string if the file has no extension."""
-        if "." in self.basename:
-            return self.basename.split(".")[-1]
-        return ""
+        return self._split()[3]
 
     @property
     def stem(self):
         """The file's stem (base name without extension)."""
-        base = self.basename
-        if "." not in base:
-            return base
-        return ".".join(base.split(".")[:-1])
+        return self._split()[2]
 
     @property
     def size(self) -> int:
@@ -1021,8 +1193,12 @@ class File(PathBase):
 
     def read(self) -> str:
         """Read the contents of a file."""
-        with open(self.path, "r", encoding=self.encoding) as f:
-            return f.read()
+        # Read raw bytes and decode once instead of going through the incremental text decoder
+        with open(self.path, "rb") as f:
+            data = f.read().decode(self.encoding or locale.getpreferredencoding(False))
+        if "\r" in data:
+            data = data.replace("\r\n", "\n").replace("\r", "\n")
+        return data
 
     def _write(self, data, mode: str, *, newline: bool = True):
         with open(self.path, mode, encoding=self.encoding) as f:
@@ -1032,8 +1208,11 @@ class File(PathBase):
 
     def _write_iter(self, data: Iterable, mode: str, sep="\n") -> None:
         with open(self.path, mode, encoding=self.encoding) as f:
-            for entry in data:
-                f.write(f"{entry}{sep}")
+            if isinstance(data, (list, tuple)):
+                if data:
+                    f.write(f"{sep.join(map(str, data))}{sep}")
+            else:
+                f.writelines(f"{entry}{sep}" for entry in data)
 
     def write(self, data, *, newline: bool = True) -> None:
         """
@@ -1103,10 +1282,10 @@ class File(PathBase):
             else:
                 raise FileNotFoundError(f"No such directory: '{directory}'")
 
-        move_path = f"{directory}{SEP}{self.basename}"
-        if os.path.exists(move_path) and not overwrite:
+        move_path = os.path.join(directory, self.basename)
+        if not overwrite and os.path.exists(move_path):
             raise FileExistsError(move_path)
-        os.rename(self.path, move_path)
+        _replace(self.path, move_path)
         self.path = move_path
         return self
 
@@ -1131,7 +1310,7 @@ class File(PathBase):
             else:
                 raise FileNotFoundError(f"No such directory: '{directory}'")
 
-        copy_path = f"{directory}{SEP}{self.basename}"
+        copy_path = os.path.join(directory, self.basename)
         if os.path.exists(copy_path) and not overwrite:
             raise FileExistsError(copy_path)
         self.path = shutil.copy2(self.path, directory)
@@ -1142,7 +1321,7 @@ class File(PathBase):
         Change the directory of the file object. This will not move the actual file to that directory.
         Use File.move_to for that.
         """
-        self.path = f"{directory}{SEP}{self.basename}"
+        self.path = os.path.join(directory, self.basename)
         return self
 
     def with_ext(self, ext: str):
@@ -1156,30 +1335,29 @@ class File(PathBase):
         """
         if not ext.startswith("."):
             ext = f".{ext}"
-        self.path = f"{self.dirname}{SEP}{self.stem}{ext}"
+        dirname, _, stem, _ = self._split()
+        self.path = os.path.join(dirname, f"{stem}{ext}")
         return self
 
     def with_suffix(self, suffix: str):
         """Add a suffix to the file's name and return the new File object."""
-        ext = self.ext
+        dirname, _, stem, ext = self._split()
         if ext:
             ext = f".{ext}"
-        filename = f"{self.stem}{suffix}{ext}"
-        self.path = f"{self.dirname}{SEP}{filename}"
+        self.path = os.path.join(dirname, f"{stem}{suffix}{ext}")
         return self
 
     def with_prefix(self, prefix: str):
         """Add a prefix to the file's name and return the new File object."""
-        ext = self.ext
+        dirname, _, stem, ext = self._split()
         if ext:
             ext = f".{ext}"
-        filename = f"{prefix}{self.stem}{ext}"
-        self.path = f"{self.dirname}{SEP}{filename}"
+        self.path = os.path.join(dirname, f"{prefix}{stem}{ext}")
         return self
 
     def rename(self, name: str):
         """Rename the file and return the new File object."""
-        new_path = f"{self.dirname}{SEP}{name}"
+        new_path = os.path.join(self.dirname, name)
         os.rename(self.path, new_path)
         self.path = new_path
         return self
@@ -1269,7 +1447,7 @@ class Directory(PathBase):
         if not os.path.exists(directory):
             raise FileNotFoundError(f"Destination directory does not exist: {directory}")
 
-        dest = f"{directory}{SEP}{self.basename}"
+        dest = os.path.join(directory, self.basename)
         shutil.move(self.path, dest)
         self.path = dest
         return self
@@ -1295,7 +1473,7 @@ class Directory(PathBase):
             else:
                 raise FileNotFoundError(f"Destination directory does not exist: {directory}")
 
-        dest = f"{directory}{SEP}{self.basename}"
+        dest = os.path.join(directory, self.basename)
         shutil.copytree(self.path, dest)
         self.path = dest
         return self
@@ -1460,6 +1638,7 @@ __all__ = [
     "splitpath",
     "start_file",
     "read_piped",
+    "read_piped_iter",
     "isdir",
     "isfile",
     "islink",
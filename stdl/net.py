@@ -1,16 +1,82 @@
 import os
-from urllib.request import urlopen, urlretrieve
+import threading
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from urllib.error import ContentTooShortError, HTTPError, URLError
+from urllib.parse import urlsplit
+from urllib.request import getproxies, proxy_bypass, urlopen
 
 from tqdm import tqdm
 
 from stdl.fs import bytes_readable, readable_size_to_bytes
 
+_CHUNK_SIZE = 1 << 20
+
+# Shared keep-alive urllib3 pool, created on the first HTTP request if urllib3 is installed.
+# False means urllib3 is unavailable and urlopen is used instead.
+_POOL = None
+_POOL_ERRORS: tuple[type[Exception], ...] = ()
+_POOL_LOCK = threading.Lock()
+
+
+def _get_pool():
+    global _POOL, _POOL_ERRORS
+    if _POOL is None:
+        with _POOL_LOCK:
+            if _POOL is None:
+                try:
+                    import urllib3
+                except ImportError:
+                    _POOL = False
+                else:
+                    _POOL_ERRORS = (urllib3.exceptions.HTTPError,)
+                    _POOL = urllib3.PoolManager(
+                        num_pools=16,
+                        maxsize=64,
+                        retries=urllib3.Retry(total=3, backoff_factor=0.3),
+                    )
+    return _POOL or None
+
+
+def _uses_proxy(url: str) -> bool:
+    parts = urlsplit(url)
+    return parts.scheme in getproxies() and not proxy_bypass(parts.hostname or "")
+
+
+@contextmanager
+def _open_url(url: str):
+    pool = None
+    if url.startswith(("http://", "https://")) and not _uses_proxy(url):
+        pool = _get_pool()
+    if pool is None:
+        with urlopen(url) as resp:
+            yield resp
+        return
+
+    try:
+        # Raw bytes as urlopen writes them: no transparent gzip/deflate decoding
+        resp = pool.request(
+            "GET", url, preload_content=False, decode_content=False, enforce_content_length=False
+        )
+    except _POOL_ERRORS as e:
+        raise URLError(e) from e
+    try:
+        if resp.status >= 400:
+            raise HTTPError(url, resp.status, resp.reason, resp.headers, None)
+        yield resp
+    except _POOL_ERRORS as e:
+        resp.close()
+        raise URLError(e) from e
+    except BaseException:
+        resp.close()
+        raise
+    finally:
+        resp.release_conn()
+
 
 class ProgressBarTQDM(tqdm):
-    def update_to(self, b=1, bsize=1, tsize=None):
-        if tsize is not None:
-            self.total = tsize
-        self.update(b * bsize - self.n)
+    """Progress bar used by ``download``."""
 
 
 class DownloadSizeExceededError(Exception):
@@ -22,6 +88,56 @@ class DownloadSizeExceededError(Exception):
         return f"File size {self.filesize} ({bytes_readable(self.filesize)}) exceeds maximum size limit of {self.maxsize} bytes ({bytes_readable(self.maxsize)})"
 
 
+def _sendfile(src, dst, bar: tqdm | None, lock: threading.Lock) -> int | None:
+    """Copy an open local file with os.sendfile. Returns None if the kernel refuses the fds."""
+    if not hasattr(os, "sendfile"):
+        return None
+    infd, outfd = src.fileno(), dst.fileno()
+    count = _CHUNK_SIZE if bar is not None else 1 << 30
+    copied = 0
+    try:
+        while sent := os.sendfile(outfd, infd, None, count):
+            copied += sent
+            if bar is not None:
+                with lock:
+                    bar.update(sent)
+    except OSError:
+        # e.g. macOS only sends to sockets; fall back to a userspace copy if nothing moved yet
+        if copied:
+            raise
+        return None
+    return copied
+
+
+def _fetch(url: str, path: str, maxsize: int | None, bar: tqdm | None, lock: threading.Lock):
+    with _open_url(url) as resp:
+        filesize = int(resp.headers.get("Content-Length", 0))
+        if maxsize is not None and filesize > maxsize:
+            raise DownloadSizeExceededError(filesize, maxsize)
+
+        with open(path, "wb") as f:
+            if bar is not None and filesize:
+                with lock:
+                    bar.total = (bar.total or 0) + filesize
+                    bar.refresh()
+            copied = _sendfile(resp, f, bar, lock) if url.startswith("file:") else None
+            if copied is None:
+                copied = 0
+                while chunk := resp.read(_CHUNK_SIZE):
+                    f.write(chunk)
+                    copied += len(chunk)
+                    if bar is not None:
+                        with lock:
+                            bar.update(len(chunk))
+
+        if filesize and copied < filesize:
+            raise ContentTooShortError(
+                f"retrieval incomplete: got only {copied} out of {filesize} bytes",
+                (path, resp.headers),
+            )
+        return path, resp.headers
+
+
 def download(
     url: str,
     path: str,
@@ -44,23 +160,53 @@ def download(
         FileExistsError: if path already exists and overwrite is set to False
         DownloadSizeExceededError: if file size exceeds maxsize
     """
-    if maxsize is not None:
-        if isinstance(maxsize, str):
-            maxsize = readable_size_to_bytes(maxsize)
-        filesize = int(urlopen(url).headers.get("Content-Length", 0))
-        if filesize > maxsize:
-            raise DownloadSizeExceededError(filesize, maxsize)
+    return download_many(
+        [(url, path)], workers=1, maxsize=maxsize, progressbar=progressbar, overwrite=overwrite
+    )[0]
+
+
+def download_many(
+    urls_paths: Iterable[tuple[str, str]],
+    workers: int = 16,
+    *,
+    maxsize: int | str | None = None,
+    progressbar: bool = False,
+    overwrite: bool = False,
+) -> list:
+    """
+    Download multiple files concurrently using a thread pool
 
-    if os.path.exists(path) and not overwrite:
-        raise FileExistsError(path)
+    Args:
+        urls_paths (Iterable[tuple[str, str]]): (url, path) pairs
+        workers (int, optional): Maximum number of concurrent downloads.
+        maxsize (int | str | None, optional): Maximum size of each file in bytes or human readable format.
+        progressbar (bool, optional): Display a single progress bar for all downloads.
+        overwrite (bool, optional): Overwrite destination paths if they already exist.
+
+    Raises:
+        FileExistsError: if a path already exists and overwrite is set to False
+        DownloadSizeExceededError: if a file size exceeds maxsize
+    """
+    urls_paths = list(urls_paths)
+    if not overwrite:
+        for _, path in urls_paths:
+            if os.path.exists(path):
+                raise FileExistsError(path)
+    if isinstance(maxsize, str):
+        maxsize = readable_size_to_bytes(maxsize)
 
-    if progressbar:
-        with ProgressBarTQDM(unit="B", unit_scale=True, unit_divisor=1024) as t:
-            r = urlretrieve(url, path, reporthook=t.update_to, data=None)
-        t.total = t.n
-    else:
-        r = urlretrieve(url, path)
-    return r
+    lock = threading.Lock()
+    with ExitStack() as stack:
+        bar = None
+        if progressbar:
+            bar = stack.enter_context(
+                ProgressBarTQDM(total=None, unit="B", unit_scale=True, unit_divisor=1024)
+            )
+        if workers <= 1 or len(urls_paths) <= 1:
+            return [_fetch(url, path, maxsize, bar, lock) for url, path in urls_paths]
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            futures = [ex.submit(_fetch, url, path, maxsize, bar, lock) for url, path in urls_paths]
+            return [future.result() for future in futures]
 
 
-__all__ = ["download"]
+__all__ = ["download", "download_many"]
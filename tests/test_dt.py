@@ -1,9 +1,19 @@
-from datetime import date
+from datetime import date, datetime
 from typing import Type
 
 import pytest
 
-from stdl.dt import date_fmt, datetime_fmt, hms_to_seconds, seconds_to_hms, time_fmt
+from stdl.dt import (
+    Timer,
+    date_fmt,
+    date_range,
+    date_range_array,
+    datetime_fmt,
+    hms_to_seconds,
+    seconds_to_hms,
+    sleep,
+    time_fmt,
+)
 
 
 @pytest.mark.parametrize(
@@ -22,6 +32,7 @@ from stdl.dt import date_fmt, datetime_fmt, hms_to_seconds, seconds_to_hms, time
         (3661.5, True, "01:01:01.500"),
         (90321.789, False, "25:05:21"),
         (90321.789, True, "25:05:21.789"),
+        (59.9996, True, "00:01:00.000"),
     ],
 )
 def test_seconds_to_hms(time_input: float, ms: bool, expected_output: Type[Exception]):
@@ -60,8 +71,7 @@ def test_hms_to_seconds(
 ):
     if expected_exception:
         with pytest.raises(expected_exception):
-            x = hms_to_seconds(time_input, ms)
-            print(time_input, ms, x)
+            hms_to_seconds(time_input, ms)
     else:
         result = hms_to_seconds(time_input, ms)
         assert result == pytest.approx(expected_output, abs=1e-9)
@@ -102,8 +112,130 @@ def test_datetime_fmt():
     assert datetime_fmt(0, fmt="dmY") == "01-01-1970 00:00:00"
     assert datetime_fmt(0, fmt="dmY", dsep="/") == "01/01/1970 00:00:00"
     assert datetime_fmt(0, fmt="dmY", dsep="/", tsep=".") == "01/01/1970 00.00.00"
+    assert datetime_fmt("2022-11-22 22:40:04.123", ms=True) == "2022-11-22 22:40:04.123"
+    assert datetime_fmt("Nov 22 2022 10:00") == "2022-11-22 10:00:00"
+
+
+def test_datetime_fmt_time_only_string():
+    from stdl import dt
+
+    assert datetime_fmt("10:00") == f"{date.today().isoformat()} 10:00:00"
+    # Missing fields come from the current date, so cached results must not outlive it
+    assert dt._parse_cached("10:00", date(2020, 1, 2)) == datetime(2020, 1, 2, 10)
+    assert dt._parse_cached("10:00", date(2020, 1, 3)) == datetime(2020, 1, 3, 10)
+
+
+@pytest.mark.parametrize(
+    "s",
+    [
+        "2022-11-22",
+        "20221122",
+        "2022-11-22 10:00",
+        "2022-11-22T22:40:04.123",
+        "20221122T101010",
+        "2022-11-22T10:00:00+02:00",
+        "2022-11-22T10:00:00Z",
+        "2022-11",
+        "2022",
+        "10:00",
+    ],
+)
+def test_parse_backends_agree(s):
+    ciso8601 = pytest.importorskip("ciso8601")
+    from dateutil.parser import parse
+
+    from stdl import dt
+
+    today = date(2020, 1, 2)
+    expected = parse(s, default=datetime(2020, 1, 2))
+    result = dt._parse_cached(s, today)
+    assert result == expected
+    assert result.utcoffset() == expected.utcoffset()
+    if dt._has_full_iso_date(s):
+        assert ciso8601.parse_datetime(s) == expected
 
 
 def test_date_fmt():
     assert date_fmt(date(1970, 1, 1)) == "1970-01-01"
     assert date_fmt(0) == "1970-01-01"
+    assert date_fmt(date(2022, 11, 22), sep="/") == "2022/11/22"
+    assert date_fmt(date(2022, 11, 22), sep="") == "20221122"
+    assert date_fmt(date(2022, 11, 22), fmt="dmY", sep="/") == "22/11/2022"
+
+
+def test_datetime_fmt_strftime_fallback():
+    d = datetime(2023, 4, 5, 6, 7, 8, 912345)
+    assert datetime_fmt(d, ms=True) == "2023-04-05 06:07:08.912"
+    assert datetime_fmt(d, fmt="mdY", dsep="/") == "04/05/2023 06:07:08"
+    assert datetime_fmt(d, fmt="ymd") == d.strftime("%y-%m-%d %H:%M:%S")
+    assert datetime_fmt(d, fmt="ymd", ms=True) == "23-04-05 06:07:08.912"
+
+
+def test_sleep():
+    assert sleep(0) == 0
+    t = sleep(0, 0.01)
+    assert 0 <= t <= 0.01
+    with pytest.raises(ValueError):
+        sleep(0.01, 0)
+
+
+def test_timer():
+    timer = Timer()
+    first = timer.stop("first")
+    second = timer.stop()
+    assert len(timer.stops) == 3
+    assert first.label == "first"
+    assert second.total >= first.total
+    assert second.at >= timer.start
+    assert timer.taken_seconds() >= 0
+
+
+def test_date_range():
+    dates = list(date_range(date(2022, 11, 19), date(2022, 11, 22)))
+    assert dates == [date(2022, 11, 19), date(2022, 11, 20), date(2022, 11, 21)]
+    assert list(date_range(date(2022, 11, 22), date(2022, 11, 19))) == []
+
+
+def test_date_range_array():
+    np = pytest.importorskip("numpy")
+    arr = date_range_array(date(2022, 11, 19), date(2022, 11, 22))
+    assert arr.dtype == np.dtype("datetime64[D]")
+    assert arr.tolist() == list(date_range(date(2022, 11, 19), date(2022, 11, 22)))
+
+
+def test_fmt_input_types():
+    class SubDatetime(datetime):
+        pass
+
+    d = SubDatetime(2022, 11, 22, 10, 20, 30)
+    assert datetime_fmt(d) == "2022-11-22 10:20:30"
+    assert time_fmt(d) == "10:20:30"
+    assert date_fmt(d) == "2022-11-22"
+    with pytest.raises(TypeError):
+        datetime_fmt(date(2022, 11, 22))
+    with pytest.raises(TypeError):
+        time_fmt("10:20:30")
+    with pytest.raises(TypeError):
+        date_fmt("2022-11-22")
+
+
+def test_timer_keep():
+    timer = Timer(keep=2)
+    for i in range(5):
+        timer.stop(str(i))
+    assert [stop.label for stop in timer.stops] == ["3", "4"]
+    timer.reset()
+    assert [stop.label for stop in timer.stops] == ["start"]
+
+
+def test_timer_totals():
+    np = pytest.importorskip("numpy")
+    timer = Timer()
+    timer.stop()
+    timer.stop()
+    totals = timer.totals()
+    assert totals.dtype == np.float64
+    assert totals.tolist() == [stop.total for stop in timer.stops]
+    assert timer.stops[-1].total_td.total_seconds() == pytest.approx(
+        timer.stops[-1].total, abs=1e-6
+    )
@@ -1,3 +1,7 @@
+import io
+import json
+import os
+import sys
 import tempfile
 from pathlib import Path
 
@@ -80,3 +84,310 @@ def test_readable_size_to_bytes():
         fs.readable_size_to_bytes("-1KB")
     with pytest.raises(ValueError):
         fs.readable_size_to_bytes("1KB", kb_size=1023)
+
+
+def test_yield_dirs_in():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_dir_path = Path(temp_dir)
+        nested = temp_dir_path / "a" / "b"
+        nested.mkdir(parents=True)
+        (temp_dir_path / "c").mkdir()
+        dirs_found = fs.get_dirs_in(temp_dir)
+        top_level = fs.get_dirs_in(temp_dir, recursive=False)
+    assert set(dirs_found) == {str(temp_dir_path / "a"), str(nested), str(temp_dir_path / "c")}
+    assert set(top_level) == {str(temp_dir_path / "a"), str(temp_dir_path / "c")}
+
+
+def test_get_dir_size():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_dir_path = Path(temp_dir)
+        (temp_dir_path / "sub").mkdir()
+        (temp_dir_path / "file1.txt").write_bytes(b"a" * 10)
+        (temp_dir_path / "sub" / "file2.txt").write_bytes(b"b" * 20)
+        assert fs.get_dir_size(temp_dir) == 30
+        assert fs.get_dir_size(temp_dir, readable=True) == "30.0 B"
+
+
+def test_file_write_iter():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file = fs.File(Path(temp_dir) / "file.txt")
+        file.write_iter([1, 2, 3])
+        assert file.read() == "1\n2\n3\n"
+        file.append_iter((str(i) for i in range(4, 6)), sep=",")
+        assert file.read() == "1\n2\n3\n4,5,"
+        file.write_iter([])
+        assert file.read() == ""
+
+
+@pytest.mark.parametrize(
+    "path, basename, stem, ext",
+    [
+        ("dir/file.txt", "file.txt", "file", "txt"),
+        ("dir/archive.tar.gz", "archive.tar.gz", "archive.tar", "gz"),
+        ("dir/README", "README", "README", ""),
+        ("dir/.bashrc", ".bashrc", "", "bashrc"),
+    ],
+)
+def test_file_name_parts(path: str, basename: str, stem: str, ext: str):
+    file = fs.File(path)
+    assert file.dirname == "dir"
+    assert file.basename == basename
+    assert file.stem == stem
+    assert file.ext == ext
+
+
+def test_file_name_parts_follow_path_changes():
+    file = fs.File("dir/file.txt")
+    assert file.ext == "txt"
+    file.with_ext("md")
+    assert file.ext == "md"
+    assert file.basename == "file.md"
+    file.with_suffix("_v2").with_prefix("new_")
+    assert file.basename == "new_file_v2.md"
+    file.path = "other/data.csv"
+    assert (file.dirname, file.stem, file.ext) == ("other", "data", "csv")
+
+
+def test_json_append():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "data.json"
+        fs.json_append({"a": 1}, path)
+        assert fs.json_load(path) == [{"a": 1}]
+        fs.json_append({"b": 2}, path)
+        assert fs.json_load(path) == [{"a": 1}, {"b": 2}]
+
+        path.write_text("")
+        fs.json_append({"c": 3}, path)
+        assert fs.json_load(path) == [{"c": 3}]
+
+        fs.json_dump({"d": 4}, path)
+        fs.json_append({"e": 5}, path)
+        assert fs.json_load(path) == [{"d": 4}, {"e": 5}]
+
+        crlf_data = {f"k{i}": i for i in range(40)}
+        with open(path, "w", encoding="utf-8", newline="\r\n") as f:
+            json.dump(crlf_data, f, indent=4)
+        fs.json_append({"x": 1}, path)
+        assert fs.json_load(path) == [crlf_data, {"x": 1}]
+
+        path.write_text("not json")
+        with pytest.raises(ValueError):
+            fs.json_append({"f": 6}, path)
+
+
+def test_file_read_translates_newlines():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "file.txt"
+        path.write_bytes("a\r\nb\rč\n".encode("utf-8"))
+        assert fs.File(path).read() == "a\nb\nč\n"
+        assert fs.File(path).read() == path.read_text(encoding="utf-8")
+        path.write_text("a\nb\n")
+        assert fs.File(path, encoding=None).read() == "a\nb\n"
+
+
+def test_file_move_to():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_dir_path = Path(temp_dir)
+        dest = temp_dir_path / "dest"
+        dest.mkdir()
+        (dest / "file.txt").write_text("old")
+        src = temp_dir_path / "file.txt"
+        src.write_text("new")
+
+        with pytest.raises(FileExistsError):
+            fs.File(src).move_to(dest, overwrite=False)
+
+        file = fs.File(src).move_to(dest)
+        assert file.path == str(dest / "file.txt")
+        assert file.read() == "new"
+        assert not src.exists()
+
+
+def test_move_files():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_dir_path = Path(temp_dir)
+        files = [temp_dir_path / "file1.txt", temp_dir_path / "file2.txt"]
+        [i.touch() for i in files]
+        dest = temp_dir_path / "dest"
+
+        with pytest.raises(FileNotFoundError):
+            fs.move_files(files, dest)
+
+        fs.move_files(files, dest, mkdir=True)
+        assert set(fs.get_files_in(dest, abs=False)) == {str(dest / i.name) for i in files}
+        assert not any(i.exists() for i in files)
+
+
+def test_move_files_many():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_dir_path = Path(temp_dir)
+        files = [temp_dir_path / f"file{i}.txt" for i in range(20)]
+        [i.touch() for i in files]
+        dest = temp_dir_path / "dest"
+        dest.mkdir()
+        fs.move_files(iter(files), dest)
+        assert set(fs.get_files_in(dest, abs=False)) == {str(dest / i.name) for i in files}
+
+
+@pytest.mark.skipif(os.rename not in os.supports_dir_fd, reason="no renameat support")
+def test_move_files_uses_dir_fd(monkeypatch):
+    opened = []
+    os_open = os.open
+
+    def tracking_open(path, *args, **kwargs):
+        opened.append(os.fspath(path))
+        return os_open(path, *args, **kwargs)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_dir_path = Path(temp_dir)
+        files = [temp_dir_path / f"file{i}.txt" for i in range(fs._DIR_FD_MOVE_THRESHOLD)]
+        [i.touch() for i in files]
+        dest = temp_dir_path / "dest"
+        dest.mkdir()
+        monkeypatch.setattr(os, "open", tracking_open)
+        fs.move_files(files, dest)
+        monkeypatch.undo()
+        assert opened == [str(dest)]
+        assert set(fs.get_files_in(dest, abs=False)) == {str(dest / i.name) for i in files}
+        assert not any(i.exists() for i in files)
+
+
+def test_ensure_paths_exist():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_dir_path = Path(temp_dir)
+        files = [temp_dir_path / f"file{i}.txt" for i in range(6)]
+        [i.touch() for i in files]
+        missing = temp_dir_path / "missing.txt"
+
+        fs.ensure_paths_exist(files[0])
+        fs.ensure_paths_exist(*files)
+        fs.ensure_paths_exist(files, temp_dir)
+        with pytest.raises(FileNotFoundError):
+            fs.ensure_paths_exist(files, missing)
+        if sys.platform != "win32":
+            broken_link = temp_dir_path / "broken_link"
+            broken_link.symlink_to(missing)
+            with pytest.raises(FileNotFoundError):
+                fs.ensure_paths_exist(files, broken_link)
+
+        fs.ensure_paths_dont_exist(missing, [temp_dir_path / "other.txt"])
+        with pytest.raises(FileExistsError):
+            fs.ensure_paths_dont_exist(missing, files)
+
+
+def test_file_with_methods_relative_path():
+    assert fs.File("file.txt").with_ext("md").path == "file.md"
+    assert fs.File("file.txt").with_suffix("_v2").path == "file_v2.txt"
+    assert fs.File("file.txt").with_prefix("new_").path == "new_file.txt"
+    assert fs.File("file.txt").with_dir("dir").path == os.path.join("dir", "file.txt")
+
+
+def test_yield_files_in_ext_case_insensitive():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_dir_path = Path(temp_dir)
+        files = [
+            temp_dir_path / "file1.TXT",
+            temp_dir_path / "file2.txt",
+            temp_dir_path / "file3.csv",
+        ]
+        [i.touch() for i in files]
+        expected = {str(files[0]), str(files[1])}
+        assert set(fs.get_files_in(temp_dir, ext=".TxT")) == expected
+        assert set(fs.get_files_in(temp_dir, ext=[".txt"], recursive=False)) == expected
+
+
+def test_pickle_roundtrip():
+    data = {"a": [1, 2, 3], "b": b"bytes", "c": None}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "data.pkl"
+        fs.pickle_dump(data, path)
+        assert fs.pickle_load(path) == data
+
+
+@pytest.mark.parametrize("indent", [None, 2, 4])
+def test_json_dump_load_roundtrip(indent):
+    from datetime import datetime
+
+    data = {"a": [1, 2.5, None, True], "b": {"nested": "č"}, 1: datetime(2022, 11, 22)}
+    expected = {"a": [1, 2.5, None, True], "b": {"nested": "č"}, "1": "2022-11-22 00:00:00"}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "data.json"
+        fs.json_dump(data, path, indent=indent)
+        assert fs.json_load(path) == expected
+        fs.json_dump(2**70, path, indent=indent)
+        assert fs.json_load(path) == 2**70
+
+
+def test_json_dump_matches_stdlib():
+    import math
+    from enum import Enum
+
+    class Color(Enum):
+        RED = "red"
+
+    data = {"x": math.nan, "y": -math.inf, "c": Color.RED, "s": "č"}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "data.json"
+        fs.json_dump(data, path)
+        assert path.read_text(encoding="utf-8") == json.dumps(data, indent=4, default=str)
+        loaded = fs.json_load(path)
+        assert math.isnan(loaded["x"]) and loaded["y"] == -math.inf
+
+
+def test_mkdirs():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        dest = Path(temp_dir) / "dest"
+        fs.mkdirs(dest, ["a", "b"])
+        fs.mkdirs(dest, ["a", "c"])
+        assert set(fs.get_dirs_in(dest, abs=False)) == {str(dest / i) for i in "abc"}
+
+
+def test_rand_filename():
+    name = fs.rand_filename("file", "txt")
+    prefix, token, ext = name.split(".")
+    assert (prefix, ext) == ("file", "txt")
+    assert len(token) == 10
+    assert name != fs.rand_filename("file", "txt")
+    assert fs.rand_filename(include_datetime=True).count(".") == 3
+
+
+def test_exec_cmd():
+    python = Path(sys.executable).as_posix()
+    cmd = f'"{python}" -c "print(1 + 1)"'
+    for bufsize in (-1, 1 << 20):
+        result = fs.exec_cmd(cmd, bufsize=bufsize)
+        assert result.returncode == 0
+        assert result.stdout_lines == ["2"]
+        assert result.time_taken > 0
+    assert fs._split_cmd(cmd) == (python, "-c", "print(1 + 1)")
+
+
+def test_start_file(monkeypatch):
+    calls = []
+    monkeypatch.setattr(fs, "_START_FILE_IMPL", calls.append)
+    fs.start_file(Path("some file.txt"))
+    assert calls == ["some file.txt"]
+
+
+def test_read_piped(monkeypatch):
+    data = "  first line\r\nsecond ☃ line\n".encode() * 3
+    monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BytesIO(data), encoding="utf-8"))
+    assert fs.read_piped() == data.decode().replace("\r\n", "\n").strip()
+
+    monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BytesIO(data), encoding="utf-8"))
+    chunks = list(fs.read_piped_iter(chunk=5))
+    assert "".join(chunks) == data.decode().replace("\r\n", "\n")
+
+    # Text already buffered by an earlier readline must not be lost
+    for read in (fs.read_piped, lambda: "".join(fs.read_piped_iter(chunk=5)).strip()):
+        monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BytesIO(data), encoding="utf-8"))
+        assert sys.stdin.readline() == "  first line\n"
+        assert read() == data.decode().replace("\r\n", "\n").split("\n", 1)[1].strip()
+
+
+@pytest.mark.skipif(os.name != "posix", reason="executable resolution is POSIX only")
+def test_exec_cmd_resolves_executable():
+    result = fs.exec_cmd(["sh", "-c", 'echo "$0"'], close_fds=False)
+    assert result.stdout_lines == ["sh"]
+    assert os.path.isabs(fs._resolve_executable("sh", os.environ.get("PATH")))
+    assert fs._resolve_executable("./sh", os.environ.get("PATH")) is None
@@ -0,0 +1,199 @@
+import gzip
+import http.client
+import socket
+import tempfile
+import threading
+from functools import partial
+from http.server import BaseHTTPRequestHandler, SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.error import ContentTooShortError, URLError
+from urllib.parse import urlsplit
+
+import pytest
+
+from stdl import net
+
+
+def test_download_file_url():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_dir_path = Path(temp_dir)
+        src = temp_dir_path / "src.bin"
+        src.write_bytes(b"x" * 3000)
+        dest = temp_dir_path / "dest.bin"
+
+        net.download(src.as_uri(), str(dest))
+        assert dest.read_bytes() == src.read_bytes()
+
+        with pytest.raises(FileExistsError):
+            net.download(src.as_uri(), str(dest))
+
+        net.download(src.as_uri(), str(dest), overwrite=True, progressbar=True)
+        assert dest.read_bytes() == src.read_bytes()
+
+
+def test_download_maxsize():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_dir_path = Path(temp_dir)
+        src = temp_dir_path / "src.bin"
+        src.write_bytes(b"x" * 3000)
+        dest = temp_dir_path / "dest.bin"
+
+        with pytest.raises(net.DownloadSizeExceededError):
+            net.download(src.as_uri(), str(dest), maxsize="2KB")
+        net.download(src.as_uri(), str(dest), maxsize="3KB")
+        assert dest.stat().st_size == 3000
+
+
+def test_download_many():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_dir_path = Path(temp_dir)
+        pairs = []
+        for i in range(5):
+            src = temp_dir_path / f"src{i}.bin"
+            src.write_bytes(bytes([i]) * (1000 + i))
+            pairs.append((src.as_uri(), str(temp_dir_path / f"dest{i}.bin")))
+
+        results = net.download_many(pairs, workers=3, progressbar=True)
+        assert [r[0] for r in results] == [p for _, p in pairs]
+        for i, (_, dest) in enumerate(pairs):
+            assert Path(dest).read_bytes() == bytes([i]) * (1000 + i)
+
+        with pytest.raises(FileExistsError):
+            net.download_many(pairs)
+
+
+def test_download_file_url_sendfile_fallback(monkeypatch):
+    def sendfile(*args):
+        raise OSError("sendfile unsupported")
+
+    monkeypatch.setattr(net.os, "sendfile", sendfile, raising=False)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_dir_path = Path(temp_dir)
+        src = temp_dir_path / "src.bin"
+        src.write_bytes(b"y" * 5000)
+        dest = temp_dir_path / "dest.bin"
+        net.download(src.as_uri(), str(dest))
+        assert dest.read_bytes() == src.read_bytes()
+
+
+def test_download_truncated_response():
+    server = socket.create_server(("127.0.0.1", 0))
+    port = server.getsockname()[1]
+
+    def serve():
+        conn, _ = server.accept()
+        with conn:
+            conn.recv(65536)
+            conn.sendall(b"HTTP/1.1 200 OK\r\nContent-Length: 10000\r\n\r\n" + b"x" * 100)
+
+    thread = threading.Thread(target=serve, daemon=True)
+    thread.start()
+    with tempfile.TemporaryDirectory() as temp_dir, server:
+        dest = Path(temp_dir) / "dest.bin"
+        with pytest.raises(ContentTooShortError):
+            net.download(f"http://127.0.0.1:{port}/file", str(dest))
+    thread.join(timeout=5)
+
+
+class _PoolError(Exception):
+    pass
+
+
+class _Pool:
+    """Minimal stand-in for urllib3.PoolManager built on http.client."""
+
+    def __init__(self):
+        self.requests = []
+
+    def request(
+        self, method, url, preload_content=True, decode_content=True, enforce_content_length=True
+    ):
+        assert not decode_content
+        self.requests.append(url)
+        parts = urlsplit(url)
+        conn = http.client.HTTPConnection(parts.hostname, parts.port)
+        try:
+            conn.request(method, parts.path)
+        except OSError as e:
+            raise _PoolError(e) from e
+        resp = conn.getresponse()
+        resp.release_conn = conn.close
+        return resp
+
+
+def test_download_http_pool(monkeypatch):
+    for var in ("http_proxy", "HTTP_PROXY", "no_proxy", "NO_PROXY"):
+        monkeypatch.delenv(var, raising=False)
+    pool = _Pool()
+    monkeypatch.setattr(net, "_POOL", pool)
+    monkeypatch.setattr(net, "_POOL_ERRORS", (_PoolError,))
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_dir_path = Path(temp_dir)
+        (temp_dir_path / "src.bin").write_bytes(b"z" * 3000)
+        handler = partial(SimpleHTTPRequestHandler, directory=temp_dir)
+        server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            base = f"http://127.0.0.1:{server.server_address[1]}"
+            dest = temp_dir_path / "dest.bin"
+            net.download(f"{base}/src.bin", str(dest), progressbar=True)
+            assert dest.read_bytes() == b"z" * 3000
+            assert pool.requests == [f"{base}/src.bin"]
+
+            with pytest.raises(net.DownloadSizeExceededError):
+                net.download(f"{base}/src.bin", str(dest), overwrite=True, maxsize=100)
+            with pytest.raises(URLError):
+                net.download(f"{base}/missing.bin", str(temp_dir_path / "missing.bin"))
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        unused = socket.socket()
+        unused.bind(("127.0.0.1", 0))
+        port = unused.getsockname()[1]
+        unused.close()
+        with pytest.raises(URLError):
+            net.download(f"http://127.0.0.1:{port}/x", str(temp_dir_path / "x.bin"))
+
+
+def test_download_skips_pool_behind_proxy(monkeypatch):
+    monkeypatch.setenv("http_proxy", "http://proxy.invalid:3128")
+    monkeypatch.delenv("no_proxy", raising=False)
+    monkeypatch.delenv("NO_PROXY", raising=False)
+    assert net._uses_proxy("http://example.com/file")
+    monkeypatch.setenv("no_proxy", "example.com")
+    assert not net._uses_proxy("http://example.com/file")
+
+
+def test_download_urllib3_keeps_encoded_body(monkeypatch):
+    pytest.importorskip("urllib3")
+    for var in ("http_proxy", "HTTP_PROXY", "no_proxy", "NO_PROXY"):
+        monkeypatch.delenv(var, raising=False)
+    monkeypatch.setattr(net, "_POOL", None)
+    body = gzip.compress(b"payload" * 1000)
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Encoding", "gzip")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            dest = Path(temp_dir) / "archive.tar.gz"
+            net.download(f"http://127.0.0.1:{server.server_address[1]}/x", str(dest))
+            assert type(net._POOL).__name__ == "PoolManager"
+            assert dest.read_bytes() == body
+    finally:
+        server.shutdown()
+        server.server_close()